@@ -1,8 +1,9 @@
 from fastapi import APIRouter
 
-from app.api.v1 import tasks, users
+from app.api.v1 import tasks, users, workspace
 
 api_router = APIRouter()
 
 api_router.include_router(tasks.router, prefix="/tasks", tags=["tasks"])
-api_router.include_router(users.router, prefix="/users", tags=["users"])
\ No newline at end of file
+api_router.include_router(users.router, prefix="/users", tags=["users"])
+api_router.include_router(workspace.router, tags=["workspace"])
\ No newline at end of file
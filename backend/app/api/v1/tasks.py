@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List
 
 from app.db.database import get_db
-from app.models.task import Task as TaskModel
+from app.models.task import Task as TaskModel, ArchivedTask as ArchivedTaskModel
 from app.schemas.task import Task, TaskCreate, TaskUpdate
 from app.middleware.auth import get_current_user
+from app.services import task_archive
 
 router = APIRouter()
 
@@ -14,9 +16,15 @@ router = APIRouter()
 async def get_tasks(
     skip: int = 0,
     limit: int = 100,
+    include_archived: bool = False,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
+    if include_archived:
+        return task_archive.get_tasks_with_history(
+            db, current_user["user_id"], skip=skip, limit=limit
+        )
+    
     tasks = db.query(TaskModel).filter(
         TaskModel.user_id == current_user["user_id"]
     ).offset(skip).limit(limit).all()
@@ -42,6 +50,7 @@ async def create_task(
 @router.get("/{task_id}", response_model=Task)
 async def get_task(
     task_id: int,
+    include_archived: bool = False,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
@@ -50,6 +59,12 @@ async def get_task(
         TaskModel.user_id == current_user["user_id"]
     ).first()
     
+    if not task and include_archived:
+        task = db.query(ArchivedTaskModel).filter(
+            ArchivedTaskModel.id == task_id,
+            ArchivedTaskModel.user_id == current_user["user_id"]
+        ).first()
+    
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -59,6 +74,34 @@ async def get_task(
     return task
 
 
+@router.post("/{task_id}/restore", response_model=Task)
+async def restore_task(
+    task_id: int,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    # Lock the row so a concurrent restore of the same task waits, then finds nothing
+    archived_task = db.query(ArchivedTaskModel).filter(
+        ArchivedTaskModel.id == task_id,
+        ArchivedTaskModel.user_id == current_user["user_id"]
+    ).with_for_update().first()
+    
+    if not archived_task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Archived task not found"
+        )
+    
+    try:
+        return task_archive.restore_task(db, archived_task)
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Task id is already in use by another task"
+        )
+
+
 @router.patch("/{task_id}", response_model=Task)
 async def update_task(
     task_id: int,
@@ -0,0 +1,118 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.orm import Session
+from typing import AsyncIterator, List
+
+from app.core.config import settings
+from app.db.database import SessionLocal, get_db
+from app.schemas.workspace import ImportSummary
+from app.middleware.auth import get_current_user
+from app.services.workspace_transfer import (
+    WorkspaceImporter,
+    WorkspaceImportError,
+    export_workspace,
+)
+
+router = APIRouter()
+
+
+def _line_too_long(line_number: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Line {line_number}: Longer than {settings.WORKSPACE_IMPORT_MAX_LINE_BYTES} bytes"
+    )
+
+
+async def _iter_lines(request: Request) -> AsyncIterator[bytes]:
+    # Only the new chunk is split, and a partial line is kept as a list of
+    # pieces joined once, so the work stays linear in the body size
+    line_number = 1
+    received = 0
+    pending: List[bytes] = []
+    pending_size = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > settings.WORKSPACE_IMPORT_MAX_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Upload is larger than {settings.WORKSPACE_IMPORT_MAX_BYTES} bytes"
+            )
+        
+        *lines, rest = chunk.split(b"\n")
+        for line in lines:
+            if pending:
+                pending.append(line)
+                line = b"".join(pending)
+                pending = []
+                pending_size = 0
+            if len(line) > settings.WORKSPACE_IMPORT_MAX_LINE_BYTES:
+                raise _line_too_long(line_number)
+            yield line
+            line_number += 1
+        
+        if rest:
+            pending.append(rest)
+            pending_size += len(rest)
+            if pending_size > settings.WORKSPACE_IMPORT_MAX_LINE_BYTES:
+                raise _line_too_long(line_number)
+    if pending:
+        yield b"".join(pending)
+
+
+@router.get("/export")
+async def export_user_workspace(
+    current_user: dict = Depends(get_current_user)
+):
+    user_id = current_user["user_id"]
+    
+    def stream():
+        # Own session: the request-scoped one is closed before streaming starts
+        db = SessionLocal()
+        try:
+            yield from export_workspace(db, user_id)
+        finally:
+            db.close()
+    
+    return StreamingResponse(
+        stream(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="workspace.ndjson"'}
+    )
+
+
+@router.post("/import", response_model=ImportSummary)
+async def import_user_workspace(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    importer = WorkspaceImporter(db, current_user["user_id"], current_user["email"])
+    try:
+        # Read the body on the event loop, but parse and write each batch in the
+        # threadpool so a long import doesn't block other requests
+        batch = []
+        async for line in _iter_lines(request):
+            batch.append(line)
+            if len(batch) >= settings.WORKSPACE_TRANSFER_BATCH_SIZE:
+                await run_in_threadpool(importer.add_lines, batch)
+                batch = []
+        await run_in_threadpool(importer.add_lines, batch)
+        return await run_in_threadpool(importer.finish)
+    except WorkspaceImportError as e:
+        await run_in_threadpool(db.rollback)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Line {importer.line_number}: {e}"
+        )
+    except (DataError, IntegrityError):
+        await run_in_threadpool(db.rollback)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Line {importer.line_number}: Invalid or conflicting data"
+        )
+    except Exception:
+        # Includes the size-limit HTTPExceptions; server faults stay 5xx
+        await run_in_threadpool(db.rollback)
+        raise
@@ -9,6 +9,15 @@ class Settings(BaseSettings):
     PROJECT_NAME: str = "Vibe Productivity"
     API_V1_STR: str = "/api/v1"
     
+    # Task archiving
+    TASK_ARCHIVE_AFTER_DAYS: int = 30
+    TASK_ARCHIVE_BATCH_SIZE: int = 1000
+    
+    # Workspace export/import
+    WORKSPACE_TRANSFER_BATCH_SIZE: int = 1000
+    WORKSPACE_IMPORT_MAX_LINE_BYTES: int = 1024 * 1024
+    WORKSPACE_IMPORT_MAX_BYTES: int = 1024 * 1024 * 1024
+    
     class Config:
         env_file = ".env"
 
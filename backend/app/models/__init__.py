@@ -1,5 +1,5 @@
 from app.models.user import User
-from app.models.task import Task, TaskStatus, TaskPriority
+from app.models.task import Task, ArchivedTask, TaskStatus, TaskPriority
 from app.models.pomodoro import PomodoroSession, PomodoroPhase, PomodoroStatus
 from app.models.achievement import Achievement, UserAchievement
 from app.models.space import SpaceConfiguration
@@ -7,6 +7,7 @@ from app.models.space import SpaceConfiguration
 __all__ = [
     "User",
     "Task",
+    "ArchivedTask",
     "TaskStatus",
     "TaskPriority",
     "PomodoroSession",
@@ -28,7 +28,8 @@ class PomodoroSession(Base):
     
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"))
-    task_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("tasks.id"), nullable=True)
+    # No FK to tasks.id: the task may have been moved to tasks_archive
+    task_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)
     
     phase: Mapped[PomodoroPhase] = mapped_column(
         SQLEnum(PomodoroPhase), 
@@ -51,4 +52,8 @@ class PomodoroSession(Base):
     
     # Relationships
     user: Mapped["User"] = relationship("User", backref="pomodoro_sessions")
-    task: Mapped[Optional["Task"]] = relationship("Task", backref="pomodoro_sessions")
\ No newline at end of file
+    task: Mapped[Optional["Task"]] = relationship(
+        "Task",
+        primaryjoin="foreign(PomodoroSession.task_id) == Task.id",
+        backref="pomodoro_sessions"
+    )
\ No newline at end of file
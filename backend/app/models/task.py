@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Boolean, Float, JSON, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Boolean, Float, JSON, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
@@ -28,7 +28,7 @@ class Task(Base):
     __tablename__ = "tasks"
     
     id: Mapped[int] = mapped_column(primary_key=True)
-    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"))
+    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), index=True)
     title: Mapped[str] = mapped_column(String)
     description: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     status: Mapped[TaskStatus] = mapped_column(
@@ -63,4 +63,46 @@ class Task(Base):
     )
     
     # Relationships
-    user: Mapped["User"] = relationship("User", backref="tasks")
\ No newline at end of file
+    user: Mapped["User"] = relationship("User", backref="tasks")
+    
+    __table_args__ = (
+        # Used by the archiver to find completed/archived tasks past the cutoff
+        Index("ix_tasks_status_updated_at", "status", "updated_at"),
+        # Archived tasks keep their ids, so SQLite must not hand out max(id) + 1 again
+        {"sqlite_autoincrement": True},
+    )
+
+
+class ArchivedTask(Base):
+    """Cold storage for tasks moved out of ``tasks`` by the archiver.
+
+    Rows keep the id they had in ``tasks`` so pomodoro sessions still
+    point at them and a restore puts them back under the same id.
+    """
+    __tablename__ = "tasks_archive"
+    
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), index=True)
+    title: Mapped[str] = mapped_column(String)
+    description: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    status: Mapped[TaskStatus] = mapped_column(SQLEnum(TaskStatus))
+    priority: Mapped[TaskPriority] = mapped_column(SQLEnum(TaskPriority))
+    
+    # 3D positioning
+    position_x: Mapped[float] = mapped_column(Float)
+    position_y: Mapped[float] = mapped_column(Float)
+    position_z: Mapped[float] = mapped_column(Float)
+    
+    # Visual properties
+    color: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    size: Mapped[float] = mapped_column(Float)
+    
+    # Time tracking
+    due_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), 
+        server_default=func.now()
+    )
\ No newline at end of file
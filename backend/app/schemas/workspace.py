@@ -0,0 +1,77 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+from app.models.task import TaskStatus
+from app.models.pomodoro import PomodoroPhase, PomodoroStatus
+from app.schemas.task import TaskBase
+
+
+EXPORT_FORMAT_VERSION = 1
+
+
+class WorkspaceHeader(BaseModel):
+    version: int = EXPORT_FORMAT_VERSION
+    exported_at: Optional[datetime] = None
+
+
+class WorkspaceFooter(BaseModel):
+    # Number of records of each kind in the export, checked on import
+    space_configuration: int = 0
+    achievements: int = 0
+    tasks: int = 0
+    pomodoro_sessions: int = 0
+
+
+class TaskRecord(TaskBase):
+    id: int  # Source id, only used to remap pomodoro references on import
+    status: TaskStatus = TaskStatus.PENDING
+    completed_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class PomodoroSessionRecord(BaseModel):
+    task_id: Optional[int] = None
+    phase: PomodoroPhase = PomodoroPhase.WORK
+    status: PomodoroStatus = PomodoroStatus.ACTIVE
+    duration_minutes: int = 25
+    elapsed_seconds: int = 0
+    started_at: Optional[datetime] = None
+    paused_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class UserAchievementRecord(BaseModel):
+    code: str
+    unlocked_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class SpaceConfigurationRecord(BaseModel):
+    world_theme: str = "default"
+    islands_layout: Optional[dict] = None
+    camera_position: Optional[dict] = None
+    camera_rotation: Optional[dict] = None
+    camera_zoom: Optional[float] = None
+    lighting_config: Optional[dict] = None
+    unlocked_blocks: list = []
+    unlocked_decorations: list = []
+    unlocked_effects: list = []
+    
+    class Config:
+        from_attributes = True
+
+
+class ImportSummary(BaseModel):
+    tasks: int = 0
+    pomodoro_sessions: int = 0
+    achievements: int = 0
+    space_configuration: bool = False
@@ -0,0 +1,129 @@
+"""Move old completed/archived tasks from ``tasks`` to ``tasks_archive``.
+
+Run periodically (e.g. from cron) with::
+
+    python -m app.services.task_archive
+"""
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import delete, insert, select, text, union_all
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models import ArchivedTask, Task, TaskStatus
+
+
+ARCHIVABLE_STATUSES = (TaskStatus.COMPLETED, TaskStatus.ARCHIVED)
+
+# Columns shared by the hot and cold tables
+TASK_COLUMNS = [column.name for column in Task.__table__.columns]
+
+
+def _check_task_ids_not_reused(db: Session) -> None:
+    # Archived tasks keep their ids. A SQLite tasks table created without
+    # AUTOINCREMENT reuses the highest id once it is archived.
+    if db.get_bind().dialect.name != "sqlite":
+        return
+    schema = db.execute(
+        text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'tasks'")
+    ).scalar()
+    if schema and "AUTOINCREMENT" not in schema.upper():
+        raise RuntimeError(
+            "The SQLite tasks table was created without AUTOINCREMENT; "
+            "recreate it before archiving so task ids are never reused"
+        )
+
+
+def archive_tasks(
+    db: Session,
+    older_than: Optional[timedelta] = None,
+    batch_size: Optional[int] = None,
+    user_id: Optional[str] = None
+) -> int:
+    """Archive tasks untouched for ``older_than`` in batches of ``batch_size``.
+
+    Each batch is committed on its own so locks stay short. Returns the
+    number of tasks moved.
+    """
+    _check_task_ids_not_reused(db)
+    if older_than is None:
+        older_than = timedelta(days=settings.TASK_ARCHIVE_AFTER_DAYS)
+    if batch_size is None:
+        batch_size = settings.TASK_ARCHIVE_BATCH_SIZE
+    
+    cutoff = datetime.now(timezone.utc) - older_than
+    candidates = select(Task.id).where(
+        Task.status.in_(ARCHIVABLE_STATUSES),
+        Task.updated_at < cutoff
+    )
+    if user_id is not None:
+        candidates = candidates.where(Task.user_id == user_id)
+    candidates = candidates.order_by(Task.id).limit(batch_size).with_for_update(skip_locked=True)
+    
+    hot = Task.__table__
+    archived = 0
+    while True:
+        ids = db.execute(candidates).scalars().all()
+        if not ids:
+            break
+        
+        db.execute(
+            insert(ArchivedTask).from_select(
+                TASK_COLUMNS,
+                select(*[hot.c[name] for name in TASK_COLUMNS]).where(hot.c.id.in_(ids))
+            )
+        )
+        db.execute(delete(Task).where(Task.id.in_(ids)))
+        db.commit()
+        
+        archived += len(ids)
+        if len(ids) < batch_size:
+            break
+    
+    return archived
+
+
+def restore_task(db: Session, archived_task: ArchivedTask) -> Task:
+    """Move a task back into ``tasks`` under its original id."""
+    task = Task(**{
+        name: getattr(archived_task, name)
+        for name in TASK_COLUMNS
+        if name != "updated_at"  # Reset so the archiver doesn't take it straight back
+    })
+    db.add(task)
+    db.delete(archived_task)
+    db.commit()
+    db.refresh(task)
+    return task
+
+
+def get_tasks_with_history(
+    db: Session,
+    user_id: str,
+    skip: int = 0,
+    limit: int = 100
+) -> List[Row]:
+    """List a user's tasks from both the hot and the cold table."""
+    hot = Task.__table__
+    cold = ArchivedTask.__table__
+    history = union_all(
+        select(*[hot.c[name] for name in TASK_COLUMNS]).where(hot.c.user_id == user_id),
+        select(*[cold.c[name] for name in TASK_COLUMNS]).where(cold.c.user_id == user_id)
+    ).subquery()
+    
+    return db.execute(
+        select(history).order_by(history.c.id).offset(skip).limit(limit)
+    ).all()
+
+
+if __name__ == "__main__":
+    from app.db.database import SessionLocal
+    
+    db = SessionLocal()
+    try:
+        count = archive_tasks(db)
+    finally:
+        db.close()
+    print(f"Archived {count} tasks")
@@ -0,0 +1,378 @@
+"""NDJSON export and import of a user's whole workspace.
+
+Each line is ``{"type": <kind>, "data": {...}}``. An export starts with a
+``workspace`` header, then the space configuration, unlocked achievements,
+tasks (hot and archived) and pomodoro sessions, so tasks always precede the
+sessions that reference them. It ends with an ``end`` record holding the
+count of each kind, so a truncated download is rejected on import.
+"""
+import enum
+import io
+import json
+from datetime import datetime, timezone
+from typing import Dict, Generator, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import Table, insert, select, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models import (
+    Achievement,
+    ArchivedTask,
+    PomodoroSession,
+    SpaceConfiguration,
+    Task,
+    User,
+    UserAchievement,
+)
+from app.schemas.workspace import (
+    EXPORT_FORMAT_VERSION,
+    ImportSummary,
+    PomodoroSessionRecord,
+    SpaceConfigurationRecord,
+    TaskRecord,
+    UserAchievementRecord,
+    WorkspaceFooter,
+    WorkspaceHeader,
+)
+
+
+RECORD_SCHEMAS: Dict[str, Type[BaseModel]] = {
+    "workspace": WorkspaceHeader,
+    "space_configuration": SpaceConfigurationRecord,
+    "achievement": UserAchievementRecord,
+    "task": TaskRecord,
+    "pomodoro_session": PomodoroSessionRecord,
+    "end": WorkspaceFooter,
+}
+
+# Record kind -> WorkspaceFooter field counting it
+FOOTER_FIELDS = {
+    "space_configuration": "space_configuration",
+    "achievement": "achievements",
+    "task": "tasks",
+    "pomodoro_session": "pomodoro_sessions",
+}
+
+
+class WorkspaceImportError(ValueError):
+    pass
+
+
+def _line(kind: str, record: BaseModel) -> str:
+    return f'{{"type":"{kind}","data":{record.model_dump_json()}}}\n'
+
+
+def _stream(db: Session, kind: str, schema: Type[BaseModel], statement) -> Generator[str, None, int]:
+    # yield_per uses a server-side cursor, so only one batch is held at a time
+    result = db.execute(
+        statement.execution_options(yield_per=settings.WORKSPACE_TRANSFER_BATCH_SIZE)
+    )
+    count = 0
+    for partition in result.partitions():
+        yield "".join(_line(kind, schema.model_validate(row._asdict())) for row in partition)
+        count += len(partition)
+    return count
+
+
+def export_workspace(db: Session, user_id: str) -> Iterator[str]:
+    """Yield the user's workspace as NDJSON chunks, one per batch of rows."""
+    if db.get_bind().dialect.name == "postgresql":
+        # One snapshot for the whole export, even if the archiver runs meanwhile
+        db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+    
+    yield _line("workspace", WorkspaceHeader(exported_at=datetime.now(timezone.utc)))
+    footer = WorkspaceFooter()
+    
+    space = db.query(SpaceConfiguration).filter(
+        SpaceConfiguration.user_id == user_id
+    ).first()
+    if space:
+        yield _line("space_configuration", SpaceConfigurationRecord.model_validate(space))
+        footer.space_configuration = 1
+    
+    footer.achievements = yield from _stream(
+        db, "achievement", UserAchievementRecord,
+        select(Achievement.code, UserAchievement.unlocked_at)
+        .join(Achievement, UserAchievement.achievement_id == Achievement.id)
+        .where(UserAchievement.user_id == user_id)
+    )
+    for table in (Task.__table__, ArchivedTask.__table__):
+        footer.tasks += yield from _stream(
+            db, "task", TaskRecord,
+            select(table).where(table.c.user_id == user_id).order_by(table.c.id)
+        )
+    sessions = PomodoroSession.__table__
+    footer.pomodoro_sessions = yield from _stream(
+        db, "pomodoro_session", PomodoroSessionRecord,
+        select(sessions).where(sessions.c.user_id == user_id).order_by(sessions.c.id)
+    )
+    
+    yield _line("end", footer)
+
+
+def _contains_nul(value) -> bool:
+    if isinstance(value, str):
+        return "\x00" in value
+    if isinstance(value, dict):
+        return any(_contains_nul(item) for item in value.values())
+    if isinstance(value, list):
+        return any(_contains_nul(item) for item in value)
+    return False
+
+
+def parse_record(line: str) -> Optional[Tuple[str, BaseModel]]:
+    """Parse one NDJSON line into ``(kind, record)``; blank lines give None."""
+    if not line.strip():
+        return None
+    try:
+        raw = json.loads(line)
+    except ValueError as e:
+        raise WorkspaceImportError(f"Invalid JSON: {e}")
+    
+    kind = raw.get("type") if isinstance(raw, dict) else None
+    if kind not in RECORD_SCHEMAS:
+        raise WorkspaceImportError(f"Unknown record type: {kind!r}")
+    # Postgres text can't hold NUL; only walk the record when an escape is present
+    if "\\u0000" in line and _contains_nul(raw):
+        raise WorkspaceImportError("Strings may not contain NUL characters")
+    try:
+        return kind, RECORD_SCHEMAS[kind].model_validate(raw.get("data") or {})
+    except ValidationError as e:
+        raise WorkspaceImportError(f"Invalid {kind} record: {e}")
+
+
+def _copy_value(value) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, enum.Enum):
+        # SQLEnum stores member names, not values
+        value = value.name
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+    else:
+        value = str(value)
+    return (
+        value.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _copy_rows(db: Session, table: Table, rows: List[dict]) -> None:
+    """Load rows with COPY FROM STDIN inside the session's transaction."""
+    columns = list(rows[0])
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(_copy_value(row[column]) for column in columns))
+        buffer.write("\n")
+    buffer.seek(0)
+    
+    dbapi = db.get_bind().dialect.loaded_dbapi
+    dbapi_connection = db.connection().connection.dbapi_connection
+    try:
+        with dbapi_connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {table.name} ({', '.join(columns)}) FROM STDIN",
+                buffer
+            )
+    except (dbapi.DataError, dbapi.IntegrityError):
+        # Raw cursor errors bypass SQLAlchemy's exception wrapping. Anything
+        # other than bad data (lost connection, timeouts) propagates as a 500
+        raise WorkspaceImportError(f"Invalid or conflicting {table.name} data")
+
+
+class WorkspaceImporter:
+    """Load parsed records into a user's workspace in batches.
+
+    The file must start with a ``workspace`` header and end with an ``end``
+    record whose counts match what was read. Nothing is committed until
+    :meth:`finish`, so a failed or truncated import leaves the workspace
+    untouched. Task ids are reassigned and pomodoro sessions
+    are pointed at the new ids; references to tasks that are not part of
+    the import are dropped.
+    """
+    
+    def __init__(self, db: Session, user_id: str, email: Optional[str] = None):
+        self.db = db
+        self.user_id = user_id
+        self.email = email
+        self.line_number = 0
+        self.batch_size = settings.WORKSPACE_TRANSFER_BATCH_SIZE
+        self.use_copy = db.get_bind().dialect.name == "postgresql"
+        self.summary = ImportSummary()
+        
+        self._task_records: List[TaskRecord] = []
+        self._session_rows: List[dict] = []
+        self._task_ids: Dict[int, Optional[int]] = {}
+        self._achievement_ids: Optional[Dict[str, int]] = None
+        self._unlocked: Optional[set] = None
+        self._space: Optional[SpaceConfiguration] = None
+        self._started = False
+        self._footer: Optional[WorkspaceFooter] = None
+        self._received = WorkspaceFooter()
+        self._now = datetime.now(timezone.utc)
+    
+    def add_lines(self, lines: Iterable[Union[str, bytes]]) -> None:
+        """Parse and add NDJSON lines, keeping :attr:`line_number` for errors."""
+        for line in lines:
+            self.line_number += 1
+            if isinstance(line, bytes):
+                try:
+                    line = line.decode("utf-8")
+                except UnicodeDecodeError as e:
+                    raise WorkspaceImportError(f"Invalid UTF-8: {e}")
+            parsed = parse_record(line)
+            if parsed:
+                self.add(*parsed)
+    
+    def add(self, kind: str, record: BaseModel) -> None:
+        if not self._started and kind != "workspace":
+            raise WorkspaceImportError("Export must start with a workspace record")
+        if self._footer is not None:
+            raise WorkspaceImportError("Unexpected record after end of export")
+        if kind in FOOTER_FIELDS:
+            field = FOOTER_FIELDS[kind]
+            setattr(self._received, field, getattr(self._received, field) + 1)
+        
+        if kind == "workspace":
+            if self._started:
+                raise WorkspaceImportError("Duplicate workspace record")
+            if record.version > EXPORT_FORMAT_VERSION:
+                raise WorkspaceImportError(
+                    f"Unsupported export version {record.version}"
+                )
+            self._ensure_user()
+            self._started = True
+        elif kind == "end":
+            self._footer = record
+        elif kind == "task":
+            if record.id in self._task_ids:
+                raise WorkspaceImportError(f"Duplicate task id {record.id}")
+            self._task_ids[record.id] = None  # Filled in when the batch is written
+            self._task_records.append(record)
+            if len(self._task_records) >= self.batch_size:
+                self._flush_tasks()
+        elif kind == "pomodoro_session":
+            # New task ids are only known once pending tasks are written
+            self._flush_tasks()
+            self._add_session(record)
+        elif kind == "achievement":
+            self._add_achievement(record)
+        elif kind == "space_configuration":
+            self._set_space_configuration(record)
+    
+    def finish(self) -> ImportSummary:
+        if not self._started:
+            raise WorkspaceImportError("Export must start with a workspace record")
+        if self._footer is None:
+            raise WorkspaceImportError("Export is incomplete: missing end record")
+        if self._footer != self._received:
+            raise WorkspaceImportError(
+                f"Export is incomplete: expected {self._footer.model_dump()}, "
+                f"got {self._received.model_dump()}"
+            )
+        
+        self._flush_tasks()
+        self._flush_sessions()
+        self.db.commit()
+        return self.summary
+    
+    def _ensure_user(self) -> None:
+        if self.db.get(User, self.user_id):
+            return
+        if not self.email:
+            raise WorkspaceImportError(
+                "No user profile yet and the token has no email; open your profile first"
+            )
+        self.db.add(User(id=self.user_id, email=self.email))
+        self.db.flush()
+    
+    def _flush_tasks(self) -> None:
+        if not self._task_records:
+            return
+        
+        rows = []
+        for record in self._task_records:
+            row = record.model_dump(exclude={"id"})
+            row["user_id"] = self.user_id
+            row["created_at"] = row["created_at"] or self._now
+            row["updated_at"] = row["updated_at"] or self._now
+            rows.append(row)
+        
+        if self.use_copy:
+            new_ids = self.db.execute(
+                text("SELECT nextval(pg_get_serial_sequence('tasks', 'id')) FROM generate_series(1, :n)"),
+                {"n": len(rows)}
+            ).scalars().all()
+            for row, new_id in zip(rows, new_ids):
+                row["id"] = new_id
+            _copy_rows(self.db, Task.__table__, rows)
+        else:
+            new_ids = self.db.execute(
+                insert(Task).returning(Task.id, sort_by_parameter_order=True),
+                rows
+            ).scalars().all()
+        
+        for record, new_id in zip(self._task_records, new_ids):
+            self._task_ids[record.id] = new_id
+        self.summary.tasks += len(rows)
+        self._task_records = []
+    
+    def _add_session(self, record: PomodoroSessionRecord) -> None:
+        row = record.model_dump()
+        row["user_id"] = self.user_id
+        row["task_id"] = self._task_ids.get(record.task_id)
+        row["started_at"] = row["started_at"] or self._now
+        self._session_rows.append(row)
+        if len(self._session_rows) >= self.batch_size:
+            self._flush_sessions()
+    
+    def _flush_sessions(self) -> None:
+        if not self._session_rows:
+            return
+        
+        if self.use_copy:
+            _copy_rows(self.db, PomodoroSession.__table__, self._session_rows)
+        else:
+            self.db.execute(insert(PomodoroSession), self._session_rows)
+        self.summary.pomodoro_sessions += len(self._session_rows)
+        self._session_rows = []
+    
+    def _add_achievement(self, record: UserAchievementRecord) -> None:
+        if self._achievement_ids is None:
+            self._achievement_ids = dict(
+                self.db.execute(select(Achievement.code, Achievement.id)).all()
+            )
+            self._unlocked = set(self.db.execute(
+                select(UserAchievement.achievement_id)
+                .where(UserAchievement.user_id == self.user_id)
+            ).scalars())
+        
+        achievement_id = self._achievement_ids.get(record.code)
+        if achievement_id is None or achievement_id in self._unlocked:
+            return
+        
+        self.db.add(UserAchievement(
+            user_id=self.user_id,
+            achievement_id=achievement_id,
+            unlocked_at=record.unlocked_at or self._now
+        ))
+        self._unlocked.add(achievement_id)
+        self.summary.achievements += 1
+    
+    def _set_space_configuration(self, record: SpaceConfigurationRecord) -> None:
+        # Kept on the importer: with autoflush off a second lookup would miss a pending row
+        if self._space is None:
+            self._space = self.db.query(SpaceConfiguration).filter(
+                SpaceConfiguration.user_id == self.user_id
+            ).first()
+        if self._space is None:
+            self._space = SpaceConfiguration(user_id=self.user_id)
+            self.db.add(self._space)
+        
+        for field, value in record.model_dump(exclude_none=True).items():
+            setattr(self._space, field, value)
+        self.summary.space_configuration = True
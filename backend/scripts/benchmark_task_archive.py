@@ -0,0 +1,152 @@
+"""Active-list latency with and without task archiving.
+
+Seeds a throwaway user with 500k old completed/archived tasks plus a
+handful of active ones, times the task list queries, archives, and
+times them again. Run from ``backend/``::
+
+    python -m scripts.benchmark_task_archive [--historical 500000]
+"""
+import argparse
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, delete, insert, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import Base
+from app.models import ArchivedTask, Task, TaskStatus, User
+from app.services.task_archive import archive_tasks
+
+
+BENCHMARK_USER_ID = "benchmark_task_archive"
+ACTIVE_STATUSES = (TaskStatus.PENDING, TaskStatus.IN_PROGRESS)
+
+
+def seed(db: Session, historical: int, active: int, chunk_size: int = 10000) -> None:
+    db.add(User(id=BENCHMARK_USER_ID, email=f"{BENCHMARK_USER_ID}@example.com"))
+    db.commit()
+    
+    old = datetime.now(timezone.utc) - timedelta(days=365)
+    for start in range(0, historical, chunk_size):
+        rows = [
+            {
+                "user_id": BENCHMARK_USER_ID,
+                "title": f"Old task {i}",
+                "status": TaskStatus.COMPLETED if i % 4 else TaskStatus.ARCHIVED,
+                # Spread history over the world, away from the active island
+                "position_x": float(i % 1000 - 500),
+                "position_z": float(i // 1000 % 1000 - 500),
+                "completed_at": old,
+                "created_at": old,
+                "updated_at": old,
+            }
+            for i in range(start, min(start + chunk_size, historical))
+        ]
+        db.execute(insert(Task), rows)
+        db.commit()
+    
+    db.execute(insert(Task), [
+        {
+            "user_id": BENCHMARK_USER_ID,
+            "title": f"Active task {i}",
+            "status": ACTIVE_STATUSES[i % 2],
+        }
+        for i in range(active)
+    ])
+    db.commit()
+
+
+def vacuum(db: Session) -> None:
+    # Clear the dead tuples left by the archiver, as autovacuum would in production
+    if db.get_bind().dialect.name == "postgresql":
+        db.commit()
+        with db.get_bind().connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("VACUUM ANALYZE tasks"))
+            connection.execute(text("VACUUM ANALYZE tasks_archive"))
+
+
+def time_query(db: Session, query, repeat: int) -> tuple[float, float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        query().all()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def run_queries(db: Session, label: str, repeat: int) -> None:
+    # GET /tasks/ stops after the first 100 index hits and the status filter is
+    # served by ix_tasks_status_updated_at, so neither depends on history size.
+    # The gain shows in filters no index covers, like the 3D viewport, which
+    # have to walk every row the user owns.
+    queries = {
+        # Same query as GET /tasks/
+        "GET /tasks/": lambda: db.query(Task).filter(
+            Task.user_id == BENCHMARK_USER_ID
+        ).offset(0).limit(100),
+        # Most recent tasks first, where the active ones live
+        "newest first": lambda: db.query(Task).filter(
+            Task.user_id == BENCHMARK_USER_ID
+        ).order_by(Task.id.desc()).offset(0).limit(100),
+        # Pending/in-progress tasks only
+        "active only": lambda: db.query(Task).filter(
+            Task.user_id == BENCHMARK_USER_ID,
+            Task.status.in_(ACTIVE_STATUSES)
+        ).limit(100),
+        # Tasks around the camera
+        "viewport": lambda: db.query(Task).filter(
+            Task.user_id == BENCHMARK_USER_ID,
+            Task.position_x.between(-10, 10),
+            Task.position_z.between(-10, 10)
+        ).limit(500),
+    }
+    print(f"\n{label}")
+    for name, query in queries.items():
+        median, p95 = time_query(db, query, repeat)
+        print(f"  {name:<14} median {median:8.2f} ms   p95 {p95:8.2f} ms")
+
+
+def cleanup(db: Session) -> None:
+    db.execute(delete(Task).where(Task.user_id == BENCHMARK_USER_ID))
+    db.execute(delete(ArchivedTask).where(ArchivedTask.user_id == BENCHMARK_USER_ID))
+    db.execute(delete(User).where(User.id == BENCHMARK_USER_ID))
+    db.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--historical", type=int, default=500_000)
+    parser.add_argument("--active", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(bind=engine)
+    
+    with Session(engine) as db:
+        cleanup(db)
+        try:
+            start = time.perf_counter()
+            seed(db, args.historical, args.active)
+            vacuum(db)
+            print(f"Seeded {args.historical} historical + {args.active} active tasks "
+                  f"in {time.perf_counter() - start:.1f} s")
+            
+            run_queries(db, "Before archiving", args.repeat)
+            
+            start = time.perf_counter()
+            archived = archive_tasks(db, user_id=BENCHMARK_USER_ID)
+            vacuum(db)
+            print(f"\nArchived {archived} tasks in {time.perf_counter() - start:.1f} s")
+            
+            run_queries(db, "After archiving", args.repeat)
+        finally:
+            cleanup(db)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Throughput and memory of the NDJSON workspace export and import.
+
+Seeds a throwaway user with 1M rows (tasks plus pomodoro sessions),
+streams the export to a temporary file, then imports that file into a
+second throwaway user. Run from ``backend/``::
+
+    python -m scripts.benchmark_workspace_transfer [--tasks 900000] [--sessions 100000]
+"""
+import argparse
+import os
+import resource
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from sqlalchemy import create_engine, delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import Base
+from app.models import PomodoroSession, SpaceConfiguration, Task, User, UserAchievement
+from app.services.workspace_transfer import WorkspaceImporter, export_workspace
+
+
+SOURCE_USER_ID = "benchmark_workspace_source"
+TARGET_USER_ID = "benchmark_workspace_target"
+
+
+def seed(db: Session, tasks: int, sessions: int, chunk_size: int = 10000) -> None:
+    db.add(User(id=SOURCE_USER_ID, email=f"{SOURCE_USER_ID}@example.com"))
+    db.add(SpaceConfiguration(user_id=SOURCE_USER_ID))
+    db.commit()
+    
+    now = datetime.now(timezone.utc)
+    for start in range(0, tasks, chunk_size):
+        db.execute(insert(Task), [
+            {
+                "user_id": SOURCE_USER_ID,
+                "title": f"Task {i}",
+                "description": "Benchmark task",
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(start, min(start + chunk_size, tasks))
+        ])
+        db.commit()
+    
+    task_ids = db.execute(
+        select(Task.id).where(Task.user_id == SOURCE_USER_ID).limit(chunk_size)
+    ).scalars().all()
+    for start in range(0, sessions, chunk_size):
+        db.execute(insert(PomodoroSession), [
+            {
+                "user_id": SOURCE_USER_ID,
+                "task_id": task_ids[i % len(task_ids)] if task_ids else None,
+                "elapsed_seconds": 1500,
+            }
+            for i in range(start, min(start + chunk_size, sessions))
+        ])
+        db.commit()
+
+
+def export_to(db: Session, path: str) -> tuple[int, int]:
+    lines = size = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for chunk in export_workspace(db, SOURCE_USER_ID):
+            f.write(chunk)
+            lines += chunk.count("\n")
+            size += len(chunk)
+    db.rollback()
+    return lines, size
+
+
+def import_from(db: Session, path: str) -> None:
+    importer = WorkspaceImporter(db, TARGET_USER_ID, f"{TARGET_USER_ID}@example.com")
+    with open(path, encoding="utf-8") as f:
+        importer.add_lines(f)
+    importer.finish()
+
+
+def cleanup(db: Session) -> None:
+    for user_id in (SOURCE_USER_ID, TARGET_USER_ID):
+        db.execute(delete(PomodoroSession).where(PomodoroSession.user_id == user_id))
+        db.execute(delete(Task).where(Task.user_id == user_id))
+        db.execute(delete(UserAchievement).where(UserAchievement.user_id == user_id))
+        db.execute(delete(SpaceConfiguration).where(SpaceConfiguration.user_id == user_id))
+        db.execute(delete(User).where(User.id == user_id))
+    db.commit()
+
+
+def max_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--tasks", type=int, default=900_000)
+    parser.add_argument("--sessions", type=int, default=100_000)
+    args = parser.parse_args()
+    rows = args.tasks + args.sessions
+    
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(bind=engine)
+    fd, path = tempfile.mkstemp(suffix=".ndjson")
+    os.close(fd)
+    
+    with Session(engine) as db:
+        cleanup(db)
+        try:
+            start = time.perf_counter()
+            seed(db, args.tasks, args.sessions)
+            print(f"Seeded {args.tasks} tasks + {args.sessions} sessions "
+                  f"in {time.perf_counter() - start:.1f} s")
+            
+            start = time.perf_counter()
+            lines, size = export_to(db, path)
+            elapsed = time.perf_counter() - start
+            print(f"\nExport: {lines} lines, {size / 2**20:.1f} MiB in {elapsed:.1f} s "
+                  f"({rows / elapsed:,.0f} rows/s, {size / 2**20 / elapsed:.1f} MiB/s)")
+            print(f"  max RSS {max_rss_mb():.0f} MiB")
+            
+            # Separate pass: tracemalloc slows the export down noticeably
+            tracemalloc.start()
+            export_to(db, path)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"  peak Python allocations {peak / 2**20:.1f} MiB "
+                  f"(batch size {settings.WORKSPACE_TRANSFER_BATCH_SIZE})")
+            
+            start = time.perf_counter()
+            import_from(db, path)
+            elapsed = time.perf_counter() - start
+            print(f"\nImport: {rows} rows in {elapsed:.1f} s ({rows / elapsed:,.0f} rows/s)")
+            print(f"  max RSS {max_rss_mb():.0f} MiB")
+        finally:
+            cleanup(db)
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""One-off schema update for databases created before task archiving.
+
+``create_all`` only creates missing tables, so an existing deployment keeps
+the ``pomodoro_sessions.task_id`` foreign key (which blocks archiving tasks
+that have sessions) and never gets the new indexes. Safe to run more than
+once. Run from ``backend/``::
+
+    python -m scripts.migrate_task_archive
+"""
+from sqlalchemy import text
+
+from app.db.database import Base, engine
+import app.models  # noqa: F401  (registers tasks_archive on Base.metadata)
+
+
+STATEMENTS = [
+    "CREATE INDEX IF NOT EXISTS ix_tasks_user_id ON tasks (user_id)",
+    "CREATE INDEX IF NOT EXISTS ix_tasks_status_updated_at ON tasks (status, updated_at)",
+    "CREATE INDEX IF NOT EXISTS ix_pomodoro_sessions_task_id ON pomodoro_sessions (task_id)",
+]
+
+POSTGRES_STATEMENTS = [
+    "ALTER TABLE pomodoro_sessions DROP CONSTRAINT IF EXISTS pomodoro_sessions_task_id_fkey",
+]
+
+
+def main() -> None:
+    Base.metadata.create_all(bind=engine)
+    
+    statements = list(STATEMENTS)
+    if engine.dialect.name == "postgresql":
+        statements = POSTGRES_STATEMENTS + statements
+    
+    with engine.begin() as connection:
+        for statement in statements:
+            connection.execute(text(statement))
+    print("Task archive schema is up to date")
+
+
+if __name__ == "__main__":
+    main()